@@ -1,9 +1,12 @@
 """Tests for tinyflux.index module."""
+from array import array
 from datetime import datetime, timezone, timedelta
+import re
+
 import pytest
 
 from tinyflux import Point, FieldQuery, TagQuery, MeasurementQuery, TimeQuery
-from tinyflux.index import Index
+from tinyflux.index import Index, IndexResult
 
 
 def test_repr():
@@ -19,6 +22,28 @@ def test_repr():
     assert repr(index) == "<Index _tags=1, _measurements=1, _timestamps=3>"
 
 
+def test_index_result_operators():
+    """Test IndexResult operators."""
+    some = IndexResult([1, 3], 4)
+
+    assert (~some).items == [0, 2]
+    assert (some & IndexResult([3], 4)).items == [3]
+    assert (some | IndexResult([2], 4)).items == [1, 2, 3]
+
+
+def test_index_result_universe():
+    """Test IndexResult operators on a result that holds every item."""
+    universe = IndexResult(range(4), 4)
+    some = IndexResult([1, 3], 4)
+
+    assert universe.items == [0, 1, 2, 3]
+    assert (~universe).items == []
+    assert (universe & some).items == [1, 3]
+    assert (some & universe).items == [1, 3]
+    assert (universe | some).items == [0, 1, 2, 3]
+    assert (some | universe).items == [0, 1, 2, 3]
+
+
 def test_initialize_empty_index():
     """Test initializing an empty Index."""
     index = Index()
@@ -35,7 +60,7 @@ def test_initialize_empty_index():
     assert isinstance(index._measurements, dict)
     assert not index._measurements
 
-    assert isinstance(index._timestamps, list)
+    assert isinstance(index._timestamps, array)
     assert not index._timestamps
 
 
@@ -74,19 +99,19 @@ def test_build():
     assert index._num_items == 3
 
     assert index._tags == {
-        "city": {"la": [0], "sf": [1]},
-        "state": {"ca": [2]},
+        "city": {"la": array("q", [0]), "sf": array("q", [1])},
+        "state": {"ca": array("q", [2])},
     }
 
     assert index._fields == {"temp": [(1, 70)], "pop": [(2, 30000000)]}
 
     assert index._measurements == {
-        "_default": [0],
-        "cities": [1],
-        "states": [2],
+        "_default": array("q", [0]),
+        "cities": array("q", [1]),
+        "states": array("q", [2]),
     }
 
-    assert index._timestamps == [i.timestamp() for i in [t1, t2, t3]]
+    assert list(index._timestamps) == [i.timestamp() for i in [t1, t2, t3]]
 
 
 def test_empty_property():
@@ -111,11 +136,24 @@ def test_insert_time_method():
 
     t1 = datetime.now(timezone.utc)
     index._insert_time(t1)
-    assert index._timestamps == [t1.timestamp()]
+    assert list(index._timestamps) == [t1.timestamp()]
 
     t2 = datetime.now(timezone.utc)
     index._insert_time(t2)
-    assert index._timestamps == [t1.timestamp(), t2.timestamp()]
+    assert list(index._timestamps) == [t1.timestamp(), t2.timestamp()]
+    assert list(index._storage_pos_sorted_by_ts) == [0, 1]
+    assert index._storage_in_time_order
+
+    # Out of time order.
+    t0 = t1 - timedelta(days=1)
+    index._insert_time(t0)
+    assert list(index._timestamps) == [
+        t0.timestamp(),
+        t1.timestamp(),
+        t2.timestamp(),
+    ]
+    assert list(index._storage_pos_sorted_by_ts) == [2, 0, 1]
+    assert not index._storage_in_time_order
 
 
 def test_index_measuments_method():
@@ -123,10 +161,13 @@ def test_index_measuments_method():
     index = Index()
 
     index._insert_measurements(0, "_default")
-    assert index._measurements == {"_default": [0]}
+    assert index._measurements == {"_default": array("q", [0])}
 
     index._insert_measurements(1, "cities")
-    assert index._measurements == {"_default": [0], "cities": [1]}
+    assert index._measurements == {
+        "_default": array("q", [0]),
+        "cities": array("q", [1]),
+    }
 
 
 def test_insert_tags_method():
@@ -134,13 +175,19 @@ def test_insert_tags_method():
     index = Index()
 
     index._insert_tags(0, {"city": "la"})
-    assert index._tags == {"city": {"la": [0]}}
+    assert index._tags == {"city": {"la": array("q", [0])}}
 
     index._insert_tags(1, {"state": "ca"})
-    assert index._tags == {"city": {"la": [0]}, "state": {"ca": [1]}}
+    assert index._tags == {
+        "city": {"la": array("q", [0])},
+        "state": {"ca": array("q", [1])},
+    }
 
     index._insert_tags(2, {"city": "la"})
-    assert index._tags == {"city": {"la": [0, 2]}, "state": {"ca": [1]}}
+    assert index._tags == {
+        "city": {"la": array("q", [0, 2])},
+        "state": {"ca": array("q", [1])},
+    }
 
 
 def test_insert_fields_method():
@@ -198,10 +245,13 @@ def test_search_measurement_query():
     index._insert_measurements(0, "_default")
     index._insert_measurements(1, "cities")
     index._insert_measurements(2, "_default")
-    assert index._measurements == {"_default": [0, 2], "cities": [1]}
+    assert index._measurements == {
+        "_default": array("q", [0, 2]),
+        "cities": array("q", [1]),
+    }
 
     rst = index.search(q)
-    assert rst.items == {0, 2}
+    assert rst.items == [0, 2]
 
 
 def test_search_time_query():
@@ -222,59 +272,116 @@ def test_search_time_query():
     index._insert_time(t3)
     index._insert_time(t4)
     index._insert_time(t5)
-    assert index._timestamps == [i.timestamp() for i in [t1, t2, t3, t4, t5]]
+    assert list(index._timestamps) == [
+        i.timestamp() for i in [t1, t2, t3, t4, t5]
+    ]
 
     # Less than or equal.
     q = TimeQuery() <= t0
-    assert index.search(q).items == set({})
+    assert index.search(q).items == []
     q = TimeQuery() <= t1
-    assert index.search(q).items == {0}
+    assert index.search(q).items == [0]
     q = TimeQuery() <= t4
-    assert index.search(q).items == {0, 1, 2, 3}
+    assert index.search(q).items == [0, 1, 2, 3]
 
     # Less than.
     q = TimeQuery() < t1
-    assert index.search(q).items == set({})
+    assert index.search(q).items == []
     q = TimeQuery() < t3
-    assert index.search(q).items == {0, 1}
+    assert index.search(q).items == [0, 1]
 
     # Greater than or equal.
     q = TimeQuery() >= t1
-    assert index.search(q).items == {0, 1, 2, 3, 4}
+    assert index.search(q).items == [0, 1, 2, 3, 4]
     q = TimeQuery() >= t3
-    assert index.search(q).items == {2, 3, 4}
+    assert index.search(q).items == [2, 3, 4]
     q = TimeQuery() >= t6
-    assert index.search(q).items == set({})
+    assert index.search(q).items == []
 
     # Greater than.
     q = TimeQuery() > t2
-    assert index.search(q).items == {2, 3, 4}
+    assert index.search(q).items == [2, 3, 4]
     q = TimeQuery() > t5
-    assert index.search(q).items == set({})
+    assert index.search(q).items == []
 
     # Equal to.
     q = TimeQuery() == t1
-    assert index.search(q).items == {0}
+    assert index.search(q).items == [0]
     q = TimeQuery() == t3
-    assert index.search(q).items == {2, 3}
+    assert index.search(q).items == [2, 3]
     q = TimeQuery() == t6
-    assert index.search(q).items == set({})
+    assert index.search(q).items == []
 
     # Not equal to.
     q = TimeQuery() != t2
-    assert index.search(q).items == {0, 2, 3, 4}
+    assert index.search(q).items == [0, 2, 3, 4]
     q = TimeQuery() != t3
-    assert index.search(q).items == {0, 1, 4}
+    assert index.search(q).items == [0, 1, 4]
     q = TimeQuery() != t6
-    assert index.search(q).items == {0, 1, 2, 3, 4}
+    assert index.search(q).items == [0, 1, 2, 3, 4]
 
     # Other type of test.
     q = TimeQuery().test(lambda x: x != t2)
-    assert index.search(q).items == {0, 2, 3, 4}
+    assert index.search(q).items == [0, 2, 3, 4]
     q = TimeQuery().test(lambda x: x != t3)
-    assert index.search(q).items == {0, 1, 4}
+    assert index.search(q).items == [0, 1, 4]
     q = TimeQuery().test(lambda x: x != t6)
-    assert index.search(q).items == {0, 1, 2, 3, 4}
+    assert index.search(q).items == [0, 1, 2, 3, 4]
+
+    # An unhashable test function.
+    class NotT3:
+        __hash__ = None
+
+        def __call__(self, x):
+            return x != t3
+
+    q = TimeQuery().test(NotT3())
+    assert index.search(q).items == [0, 1, 4]
+
+
+def test_search_time_query_storage_out_of_time_order():
+    """Test search_query of Index on TimeQuery with unsorted storage."""
+    t_now = datetime.now(timezone.utc)
+
+    t1 = t_now - timedelta(days=2)
+    t2 = t_now - timedelta(days=1)
+    t3 = t_now
+
+    index = Index()
+    index.build(
+        [Point(time=t3), Point(time=t1), Point(time=t2), Point(time=t1)]
+    )
+    assert not index._storage_in_time_order
+    assert list(index._timestamps) == [i.timestamp() for i in [t1, t1, t2, t3]]
+    assert index._storage_pos_sorted_by_ts == array("q", [1, 3, 2, 0])
+
+    assert index.search(TimeQuery() == t1).items == [1, 3]
+    assert index.search(TimeQuery() != t1).items == [0, 2]
+    assert index.search(TimeQuery() < t2).items == [1, 3]
+    assert index.search(TimeQuery() <= t2).items == [1, 2, 3]
+    assert index.search(TimeQuery() > t1).items == [0, 2]
+    assert index.search(TimeQuery() >= t2).items == [0, 2]
+    assert index.search(TimeQuery().test(lambda x: x != t2)).items == [0, 1, 3]
+
+    # Each distinct timestamp is tested once.
+    calls = []
+
+    def time_test(x):
+        calls.append(x)
+        return x != t2
+
+    assert index.search(TimeQuery().test(time_test)).items == [0, 1, 3]
+    assert calls == [t1, t2, t3]
+
+    # Timestamps are returned in storage order.
+    assert index.get_timestamps() == [i.timestamp() for i in [t3, t1, t2, t1]]
+    assert index.get_timestamps("_default") == index.get_timestamps()
+
+    # Removing items shifts the storage positions of the remaining ones.
+    index.remove({1})
+    assert list(index._timestamps) == [i.timestamp() for i in [t1, t2, t3]]
+    assert index._storage_pos_sorted_by_ts == array("q", [2, 1, 0])
+    assert index.search(TimeQuery() >= t2).items == [0, 1]
 
 
 def test_search_tags_query():
@@ -286,34 +393,34 @@ def test_search_tags_query():
     index._insert_tags(2, {"city": "sf"})
     index._insert_tags(3, {"neighborhood": "dtla"})
     assert index._tags == {
-        "city": {"la": [0], "sf": [1, 2]},
-        "state": {"ca": [0, 1]},
-        "neighborhood": {"dtla": [3]},
+        "city": {"la": array("q", [0]), "sf": array("q", [1, 2])},
+        "state": {"ca": array("q", [0, 1])},
+        "neighborhood": {"dtla": array("q", [3])},
     }
 
     rst = index.search(TagQuery().city == "la")
-    assert rst.items == {0}
+    assert rst.items == [0]
 
     rst = index.search(TagQuery().city != "la")
-    assert rst.items == {1, 2}
+    assert rst.items == [1, 2]
 
     rst = index.search(TagQuery().city == "sf")
-    assert rst.items == {1, 2}
+    assert rst.items == [1, 2]
 
     rst = index.search(TagQuery().city != "sf")
-    assert rst.items == {0}
+    assert rst.items == [0]
 
     rst = index.search(TagQuery().state == "ca")
-    assert rst.items == {0, 1}
+    assert rst.items == [0, 1]
 
     rst = index.search(TagQuery().state != "ca")
-    assert rst.items == set({})
+    assert rst.items == []
 
     rst = index.search(TagQuery().neighborhood == "dtla")
-    assert rst.items == {3}
+    assert rst.items == [3]
 
     rst = index.search(TagQuery().neighborhood != "dtla")
-    assert rst.items == set({})
+    assert rst.items == []
 
 
 def test_search_field_query():
@@ -331,22 +438,97 @@ def test_search_field_query():
 
     # Queries.
     rst = index.search(FieldQuery().temp == 70.0)
-    assert rst.items == set({})
+    assert rst.items == []
 
     rst = index.search(FieldQuery().temp != 70.0)
-    assert rst.items == {0, 1}
+    assert rst.items == [0, 1]
 
     rst = index.search(FieldQuery().pop >= 10000000)
-    assert rst.items == set({2})
+    assert rst.items == [2]
 
     rst = index.search(FieldQuery().pop > 40000000)
-    assert rst.items == set({})
+    assert rst.items == []
 
     rst = index.search(FieldQuery().pop < 1000)
-    assert rst.items == set({})
+    assert rst.items == []
 
     rst = index.search(FieldQuery().pop <= 1000)
-    assert rst.items == set({})
+    assert rst.items == []
+
+
+def test_search_key_matches_cache():
+    """Test that key test results are cached per query."""
+    t = datetime.now(timezone.utc)
+    calls = []
+
+    def city_test(x):
+        calls.append(x)
+        return x == "la"
+
+    index = Index()
+    index.build(
+        [
+            Point(time=t, tags={"city": "la"}, fields={"temp": 70.0}),
+            Point(time=t, tags={"city": "sf", "state": "ca"}),
+        ]
+    )
+
+    q = TagQuery().city.test(city_test)
+    assert index.search(q).items == [0]
+    assert sorted(calls) == ["la", "sf"]
+
+    # An equal query reuses the cached results.
+    assert index.search(q).items == [0]
+    assert index.search(TagQuery().city.test(city_test)).items == [0]
+    assert sorted(calls) == ["la", "sf"]
+    assert len(index._key_matches) == 1
+
+    # New keys are tested.
+    index.insert([Point(time=t, tags={"city": "nyc"})])
+    assert index.search(q).items == [0]
+    assert sorted(calls) == ["la", "nyc", "sf"]
+
+    # Measurement and field queries are cached too.
+    assert index.search(MeasurementQuery() == "_default").items == [0, 1, 2]
+    assert index.search(FieldQuery().temp == 70.0).items == [0]
+    assert index._key_matches[MeasurementQuery() == "_default"] == {
+        "_default": True
+    }
+    assert index._key_matches[FieldQuery().temp == 70.0] == {"temp": True}
+
+    # Unhashable and noop queries are not cached.
+    assert index.search(TagQuery().city.map(str.upper) == "LA").items == [0]
+    assert index.search(TagQuery().noop()).items == [0, 1, 2]
+    assert index.search(TagQuery().city.test(lambda x, y: True, [])).items == [
+        0,
+        1,
+        2,
+    ]
+    assert len(index._key_matches) == 3
+
+    # The oldest queries are evicted.
+    for i in range(index._key_matches_capacity):
+        index.search(TagQuery().city == str(i))
+
+    assert len(index._key_matches) == index._key_matches_capacity
+    assert q not in index._key_matches
+
+    # A reset clears the cache.
+    index._reset()
+    assert not index._key_matches
+
+
+def test_search_key_matches_cache_regex_flags():
+    """Test that regex queries differing only by flags are cached apart."""
+    t = datetime.now(timezone.utc)
+
+    index = Index()
+    index.build([Point(time=t, tags={"a": "ABC"})])
+
+    assert index.search(TagQuery().a.matches("abc")).items == []
+    assert index.search(TagQuery().a.matches("abc", re.I)).items == [0]
+    assert index.search(TagQuery().a.search("b")).items == []
+    assert index.search(TagQuery().a.search("b", re.I)).items == [0]
 
 
 def test_search_compound_query_not():
@@ -374,24 +556,33 @@ def test_search_compound_query_not():
 
     # Measurement query.
     rst = index.search(~meas_q)
-    assert rst.items == {0, 1}
+    assert rst.items == [0, 1]
 
     # Field query. Note for Field Queries, a NOT operator means we have to
     # check every single item in the storage layer.
     rst = index.search(~fiel_q)
-    assert rst.items == {0, 1}
+    assert rst.items == [0, 1]
+
+    # The complement of a FieldQuery is not materialized.
+    assert isinstance(rst._items, range)
 
     # Compount NOT FieldQuery.
     rst = index.search(~fiel_q & tags_q)
-    assert rst.items == {0}
+    assert rst.items == [0]
+
+    rst = index.search(~fiel_q & ~fiel_q)
+    assert rst.items == [0, 1]
+
+    rst = index.search(tags_q | ~fiel_q)
+    assert rst.items == [0, 1]
 
     # Time query.
     rst = index.search(~time_q)
-    assert rst.items == {0}
+    assert rst.items == [0]
 
     # Tag query.
     rst = index.search(~tags_q)
-    assert rst.items == {1}
+    assert rst.items == [1]
 
 
 def test_search_compound_query_and():
@@ -431,27 +622,27 @@ def test_search_compound_query_and():
 
     # Measurement and Field.
     rst = index.search(meas_q & fiel_q)
-    assert rst.items == {0}
+    assert rst.items == [0]
 
     # Measurement and Time.
     rst = index.search(meas_q & time_q)
-    assert rst.items == {2}
+    assert rst.items == [2]
 
     # Measurement and Tags.
     rst = index.search(meas_q & tags_q)
-    assert rst.items == {0, 2}
+    assert rst.items == [0, 2]
 
     # Field and Time.
     rst = index.search(fiel_q & time_q)
-    assert rst.items == set({})
+    assert rst.items == []
 
     # Field and Tags.
     rst = index.search(fiel_q & tags_q)
-    assert rst.items == {0}
+    assert rst.items == [0]
 
     # Time and Tags.
     rst = index.search(time_q & tags_q)
-    assert rst.items == {2}
+    assert rst.items == [2]
 
 
 def test_search_compound_query_or():
@@ -491,27 +682,60 @@ def test_search_compound_query_or():
 
     # Measurement or Field.
     rst = index.search(meas_q | fiel_q)
-    assert rst.items == {0, 2}
+    assert rst.items == [0, 2]
 
     # Measurement or Time.
     rst = index.search(meas_q | time_q)
-    assert rst.items == {0, 2}
+    assert rst.items == [0, 2]
 
     # Measurement or Tags.
     rst = index.search(meas_q | tags_q)
-    assert rst.items == {0, 2}
+    assert rst.items == [0, 2]
 
     # Field or Time.
     rst = index.search(fiel_q | time_q)
-    assert rst.items == {0, 2}
+    assert rst.items == [0, 2]
 
     # Field or Tags.
     rst = index.search(fiel_q | tags_q)
-    assert rst.items == {0, 2}
+    assert rst.items == [0, 2]
 
     # Time or Tags.
     rst = index.search(time_q | tags_q)
-    assert rst.items == {0, 2}
+    assert rst.items == [0, 2]
+
+
+def test_search_compound_query_chains():
+    """Test search_query of Index on chains of 'and' and 'or' queries."""
+    t = datetime.now(timezone.utc)
+
+    index = Index()
+    index.build(
+        [
+            Point(time=t, measurement="m1", tags={"a": "1", "b": "1"}),
+            Point(time=t, measurement="m1", tags={"a": "1", "b": "2"}),
+            Point(time=t, measurement="m2", tags={"a": "2", "b": "1"}),
+            Point(time=t, measurement="m2", tags={"a": "1", "b": "1"}),
+        ]
+    )
+
+    m1_q = MeasurementQuery() == "m1"
+    m2_q = MeasurementQuery() == "m2"
+    a1_q = TagQuery().a == "1"
+    b1_q = TagQuery().b == "1"
+    b2_q = TagQuery().b == "2"
+
+    assert index.search(a1_q & b1_q & m2_q).items == [3]
+    assert index.search(m1_q & (a1_q & b1_q)).items == [0]
+    assert index.search(a1_q & b1_q & m1_q & m2_q).items == []
+    assert index.search(m1_q & (TagQuery().c == "1") & a1_q).items == []
+
+    assert index.search(b2_q | m2_q | (TagQuery().a == "2")).items == [1, 2, 3]
+    assert index.search(b2_q | (m2_q | m1_q)).items == [0, 1, 2, 3]
+
+    assert index.search((m1_q | m2_q) & b2_q).items == [1]
+    assert index.search((m1_q & b2_q) | (m2_q & b1_q & a1_q)).items == [1, 3]
+    assert index.search(~(a1_q & b1_q) & ~m2_q).items == [1]
 
 
 def test_update():
@@ -524,3 +748,102 @@ def test_update():
 
     index.insert([Point(time=t)])
     assert index._num_items == 3
+
+    index = Index()
+    index.build(
+        [
+            Point(time=t, measurement="m1", tags={"a": "1"}, fields={"f": 1}),
+            Point(time=t, measurement="m2", tags={"a": "2"}, fields={"g": 2}),
+            Point(time=t, measurement="m2", tags={"a": "2"}, fields={"g": 3}),
+            Point(time=t, measurement="m1", tags={"a": "1"}, fields={"f": 4}),
+        ]
+    )
+
+    # Remove the second item and shift the rest down.
+    index.remove({1})
+    index.update({2: 1, 3: 2})
+    assert index._measurements == {
+        "m1": array("q", [0, 2]),
+        "m2": array("q", [1]),
+    }
+    assert index._tags == {"a": {"1": array("q", [0, 2]), "2": array("q", [1])}}
+    assert index._fields == {"f": [(0, 1), (2, 4)], "g": [(1, 3)]}
+
+    # An empty update changes nothing.
+    index.update({})
+    assert index._measurements == {
+        "m1": array("q", [0, 2]),
+        "m2": array("q", [1]),
+    }
+
+    # Posting lists before the first moved item are kept as they are.
+    index = Index()
+    index.build(
+        [
+            Point(time=t, measurement="m1", tags={"a": "1"}, fields={"f": 1}),
+            Point(time=t, measurement="m2", tags={"a": "2"}, fields={"g": 2}),
+            Point(time=t, measurement="m2", tags={"a": "2"}, fields={"g": 3}),
+        ]
+    )
+    m1_items = index._measurements["m1"]
+
+    index.remove({1})
+    index.update({2: 1})
+    assert index._measurements == {
+        "m1": array("q", [0]),
+        "m2": array("q", [1]),
+    }
+    assert index._measurements["m1"] is m1_items
+    assert index._tags == {"a": {"1": array("q", [0]), "2": array("q", [1])}}
+    assert index._fields == {"f": [(0, 1)], "g": [(1, 3)]}
+
+
+def test_remove():
+    """Test remove method of Index."""
+    t = datetime.now(timezone.utc)
+
+    index = Index()
+    index.build(
+        [
+            Point(time=t, measurement="m1", tags={"a": "1"}, fields={"f": 1}),
+            Point(time=t, measurement="m1", tags={"a": "1"}, fields={"f": 2}),
+            Point(time=t, measurement="m2", tags={"a": "2"}, fields={"g": 3}),
+            Point(time=t, measurement="m2", tags={"b": "3"}, fields={"g": 4}),
+        ]
+    )
+    m1_items = index._measurements["m1"]
+
+    index.remove({2, 3})
+    assert index._num_items == 2
+    assert index._measurements == {"m1": array("q", [0, 1])}
+    assert index._tags == {"a": {"1": array("q", [0, 1])}}
+    assert index._fields == {"f": [(0, 1), (1, 2)]}
+    assert list(index._timestamps) == [t.timestamp()] * 2
+
+    # Posting lists without removed items are kept as they are.
+    assert index._measurements["m1"] is m1_items
+
+    index.remove({0})
+    assert index._num_items == 1
+    assert index._measurements == {"m1": array("q", [1])}
+    assert index._tags == {"a": {"1": array("q", [1])}}
+    assert index._fields == {"f": [(1, 2)]}
+
+    # Posting lists can still be appended to after a remove.
+    index.update({1: 0})
+    index.insert([Point(time=t, measurement="m3", tags={"c": "4"})])
+    assert index._measurements == {"m1": array("q", [0]), "m3": array("q", [1])}
+    assert index._tags == {
+        "a": {"1": array("q", [0])},
+        "c": {"4": array("q", [1])},
+    }
+
+    # Items before and after the removed range are kept.
+    index = Index()
+    index.build(
+        [Point(time=t, tags={"a": "1"}, fields={"f": i}) for i in range(6)]
+    )
+    index.remove({2, 4})
+    assert index._measurements == {"_default": array("q", [0, 1, 3, 5])}
+    assert index._tags == {"a": {"1": array("q", [0, 1, 3, 5])}}
+    assert index._fields == {"f": [(0, 0), (1, 1), (3, 3), (5, 5)]}
@@ -2,6 +2,7 @@
 
 Tests are generally organized by TinyFlux class method.
 """
+from array import array
 import csv
 from datetime import datetime, timezone, timedelta
 import os
@@ -689,8 +690,10 @@ def test_reindex(tmpdir, capsys):
     assert db.index.valid
     assert not db.index.empty
     assert len(db.index) == 3
-    assert db.index._timestamps == [i.time.timestamp() for i in [p1, p2, p3]]
-    assert db.index._measurements == {"_default": [0, 1, 2]}
+    assert list(db.index._timestamps) == [
+        i.time.timestamp() for i in [p1, p2, p3]
+    ]
+    assert db.index._measurements == {"_default": array("q", [0, 1, 2])}
     assert not db.index._tags
     assert not db.index._fields
 
@@ -2,13 +2,14 @@
 import pytest
 
 from tinyflux.utils import (
+    difference_generator_and_sorted_lists,
     freeze,
     FrozenDict,
-    find_eq,
-    find_ge,
-    find_gt,
-    find_le,
-    find_lt,
+    GALLOPING_THRESHOLD,
+    intersection_galloping,
+    intersection_two_sorted_lists,
+    union_sorted_lists,
+    union_two_sorted_lists,
 )
 
 
@@ -45,151 +46,91 @@ def test_frozen_dict_hash():
     assert hash(my_frozen_set2) != hash(my_frozen_set3)
 
 
-def test_find_eq():
-    """Test the find_eq function."""
-    present_numbers = range(3)
-    absent_numbers = range(3, 6)
-
-    # Normal sorted list.
-    my_list = [i for i in present_numbers]
-
-    for i, n in enumerate(present_numbers):
-        assert find_eq(my_list, n) == i
-
-    for i, n in enumerate(absent_numbers):
-        assert find_eq(my_list, n) is None
-
-    # Empty list.
-    my_list = []
-
-    for n in present_numbers:
-        assert find_eq(my_list, n) is None
-
-    for i, n in enumerate(absent_numbers):
-        assert find_eq(my_list, n) is None
-
-
-def test_find_lt():
-    """Test the find_lt function."""
-    present_numbers = range(3, 6)
-    absent_numbers1 = range(3)
-    absent_numbers2 = range(6, 9)
-
-    # Normal sorted list.
-    my_list = [i for i in present_numbers]
-
-    assert find_lt(my_list, 3) is None
-    assert find_lt(my_list, 4) == 0
-    assert find_lt(my_list, 5) == 1
-
-    for n in absent_numbers1:
-        assert find_lt(my_list, n) is None
-
-    for n in absent_numbers2:
-        assert find_lt(my_list, n) == 2
-
-    # Empty list.
-    my_list = []
-
-    for n in present_numbers:
-        assert find_lt(my_list, n) is None
-
-    for n in absent_numbers1:
-        assert find_lt(my_list, n) is None
-
-    for n in absent_numbers2:
-        assert find_lt(my_list, n) is None
-
-
-def test_find_le():
-    """Test the find_le function."""
-    present_numbers = range(3, 6)
-    absent_numbers1 = range(3)
-    absent_numbers2 = range(6, 9)
-
-    # Normal sorted list.
-    my_list = [i for i in present_numbers]
-
-    for i, n in enumerate(present_numbers):
-        assert find_le(my_list, n) == i
-
-    for n in absent_numbers1:
-        assert find_le(my_list, n) is None
-
-    for n in absent_numbers2:
-        assert find_le(my_list, n) == 2
-
-    # Empty list.
-    my_list = []
-
-    for n in present_numbers:
-        assert find_le(my_list, n) is None
-
-    for n in absent_numbers1:
-        assert find_le(my_list, n) is None
-
-    for n in absent_numbers2:
-        assert find_le(my_list, n) is None
-
-
-def test_find_gt():
-    """Test the find_gt function."""
-    present_numbers = range(3, 6)
-    absent_numbers1 = range(3)
-    absent_numbers2 = range(6, 9)
-
-    # Normal sorted list.
-    my_list = [i for i in present_numbers]
-
-    assert find_gt(my_list, 3) == 1
-    assert find_gt(my_list, 4) == 2
-    assert find_gt(my_list, 5) is None
-
-    for n in absent_numbers1:
-        assert find_gt(my_list, n) == 0
-
-    for n in absent_numbers2:
-        assert find_gt(my_list, n) is None
-
-    # Empty list.
-    my_list = []
-
-    for n in present_numbers:
-        assert find_gt(my_list, n) is None
-
-    for n in absent_numbers1:
-        assert find_gt(my_list, n) is None
-
-    for n in absent_numbers2:
-        assert find_gt(my_list, n) is None
-
-
-def test_find_ge():
-    """Test the find_ge function."""
-    present_numbers = range(3, 6)
-    absent_numbers1 = range(3)
-    absent_numbers2 = range(6, 9)
-
-    # Normal sorted list.
-    my_list = [i for i in present_numbers]
-
-    for i, n in enumerate(present_numbers):
-        assert find_ge(my_list, n) == i
-
-    for n in absent_numbers1:
-        assert find_ge(my_list, n) == 0
-
-    for n in absent_numbers2:
-        assert find_ge(my_list, n) is None
-
-    # Empty list.
-    my_list = []
-
-    for n in present_numbers:
-        assert find_ge(my_list, n) is None
-
-    for n in absent_numbers1:
-        assert find_ge(my_list, n) is None
-
-    for n in absent_numbers2:
-        assert find_ge(my_list, n) is None
+def test_difference_generator_and_sorted_lists():
+    """Test the difference_generator_and_sorted_lists function."""
+    assert difference_generator_and_sorted_lists(range(0), []) == []
+    assert difference_generator_and_sorted_lists(range(3), []) == [0, 1, 2]
+    assert difference_generator_and_sorted_lists(range(3), [0, 1, 2]) == []
+    assert difference_generator_and_sorted_lists(range(5), [1, 3]) == [0, 2, 4]
+    assert difference_generator_and_sorted_lists([2, 4], [1, 4, 6]) == [2]
+
+
+def test_intersection_galloping():
+    """Test the intersection_galloping function."""
+    large = list(range(0, 1000, 2))
+
+    assert intersection_galloping([], large) == []
+    assert intersection_galloping([1], []) == []
+    assert intersection_galloping([0], large) == [0]
+    assert intersection_galloping([998], large) == [998]
+    assert intersection_galloping([999, 1000], large) == []
+    assert intersection_galloping([1, 3, 5], large) == []
+    assert intersection_galloping([-1, 4, 5, 500, 997, 998], large) == [
+        4,
+        500,
+        998,
+    ]
+
+    small = list(range(0, 1000, 7))
+    assert intersection_galloping(small, large) == sorted(
+        set(small).intersection(large)
+    )
+
+
+def test_intersection_two_sorted_lists():
+    """Test the intersection_two_sorted_lists function."""
+    assert intersection_two_sorted_lists([], []) == []
+    assert intersection_two_sorted_lists([1, 2], []) == []
+    assert intersection_two_sorted_lists([], [1, 2]) == []
+    assert intersection_two_sorted_lists([1, 2], [3, 4]) == []
+    assert intersection_two_sorted_lists([1, 2, 3], [2, 3, 4]) == [2, 3]
+    assert intersection_two_sorted_lists([0, 5, 9], list(range(10))) == [
+        0,
+        5,
+        9,
+    ]
+
+    # Ranges that barely or do not overlap.
+    assert intersection_two_sorted_lists([1, 2, 3], [3, 4, 5]) == [3]
+    assert intersection_two_sorted_lists([4, 5], [1, 2, 3]) == []
+    assert intersection_two_sorted_lists(range(100), [99, 200]) == [99]
+
+    # Skewed sizes.
+    large = list(range(GALLOPING_THRESHOLD * 10))
+    assert intersection_two_sorted_lists([3, 7, 400], large) == [3, 7]
+    assert intersection_two_sorted_lists(large, [3, 7, 400]) == [3, 7]
+
+
+def test_union_two_sorted_lists():
+    """Test the union_two_sorted_lists function."""
+    assert union_two_sorted_lists([], []) == []
+    assert union_two_sorted_lists([1, 2], []) == [1, 2]
+    assert union_two_sorted_lists([], [1, 2]) == [1, 2]
+    assert union_two_sorted_lists([1, 3], [2, 4]) == [1, 2, 3, 4]
+    assert union_two_sorted_lists([1, 2, 3], [2, 3, 4]) == [1, 2, 3, 4]
+    assert union_two_sorted_lists([5], [0, 1, 9]) == [0, 1, 5, 9]
+
+    # Inputs are not mutated.
+    l1, l2 = [1, 3], [2]
+    union_two_sorted_lists(l1, l2)
+    assert l1 == [1, 3] and l2 == [2]
+
+
+def test_union_sorted_lists():
+    """Test the union_sorted_lists function."""
+    assert union_sorted_lists([]) == []
+    assert union_sorted_lists([[]]) == []
+    assert union_sorted_lists([[1, 2]]) == [1, 2]
+    assert union_sorted_lists([[1, 3], [2, 3]]) == [1, 2, 3]
+    assert union_sorted_lists([[5, 9], [], [0, 5], [1, 9, 10]]) == [
+        0,
+        1,
+        5,
+        9,
+        10,
+    ]
+
+    # Inputs are not mutated or returned.
+    l1 = [1, 2]
+    rst = union_sorted_lists([l1])
+    assert rst == l1 and rst is not l1
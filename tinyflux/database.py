@@ -424,7 +424,7 @@ class TinyFlux:
         if use_index:
             for i, item in enumerate(self._storage):
                 # Not a candidate.
-                if i not in index_rst._items:
+                if i != index_rst._items[0]:
                     continue
 
                 # Candidate, no further evaluation necessary.
@@ -844,7 +844,7 @@ class TinyFlux:
 
             for i, item in enumerate(self._storage):
                 # Not a candidate, skip.
-                if i not in index_rst._items:
+                if i != index_rst._items[j]:
                     continue
 
                 # Match or candidate match.
@@ -950,7 +950,7 @@ class TinyFlux:
 
             for i, item in enumerate(self._storage):
                 # Not in result set, skip.
-                if i not in index_rst._items:
+                if i != index_rst._items[j]:
                     continue
 
                 _point = self._storage._deserialize_storage_item(item)
@@ -1376,9 +1376,9 @@ class TinyFlux:
                 return 0
 
             # Items, but it's all of them.
-            if len(index_rst.items) == len(self._index):
+            if len(index_rst._items) == len(self._index):
                 self._reset_database()
-                return len(index_rst.items)
+                return len(index_rst._items)
 
         # A set of items marked for removal.
         removed_items = set({})
@@ -1398,7 +1398,7 @@ class TinyFlux:
 
             for i, item in enumerate(self._storage):
                 # No more items or item is not a candidate.
-                if j == len(index_rst._items) or i not in index_rst._items:
+                if j == len(index_rst._items) or i != index_rst._items[j]:
                     self._storage.append([item], temporary=True)
 
                     # Add to updated_items if the item has a new position.
@@ -1540,12 +1540,14 @@ class TinyFlux:
 
             for i, item in enumerate(self._storage):
                 # Not a query match, pass item through.
-                if j == len(index_rst.items) or i not in index_rst._items:
+                if j == len(index_rst._items) or i != index_rst._items[j]:
                     self._storage.append([item], temporary=True)
                     continue
 
                 _point = self._storage._deserialize_storage_item(item)
 
+                j += 1
+
                 # Attempt update.
                 u = perform_update(_point)
 
@@ -1563,8 +1565,6 @@ class TinyFlux:
                 else:
                     self._storage.append([item], temporary=True)
 
-                j += 1
-
         # Update without the help of the index.
         else:
             for item in self._storage:
@@ -8,13 +8,33 @@ Index instance is not a part of the TinyFlux interface.
 An IndexResult returns the indicies of revelant TinyFlux queries for further
 handling, usually as an input to a storage retrieval.
 """
+from array import array
+import bisect
+from collections import defaultdict
 from datetime import datetime, timezone
 import operator
-from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from tinyflux.queries import SimpleQuery, CompoundQuery, Query
 from .point import FieldSet, FieldValue, Point, TagSet
-from .utils import find_eq, find_lt, find_le, find_gt, find_ge
+from .utils import (
+    difference_generator_and_sorted_lists,
+    intersection_two_sorted_lists,
+    union_sorted_lists,
+    union_two_sorted_lists,
+)
 
 
 class IndexResult:
@@ -23,29 +43,37 @@ class IndexResult:
     IndexResults instances are generated by an Index.
 
     Arritributes:
-        items: A set of indicies as ints.
+        items: A sorted list of unique indicies as ints.
+
+    A query that may match every item holds a range over the whole index in
+    place of a list, which is not materialized unless it is requested.
 
     Usage:
-        >>> IndexResult(items=set(), index_count=0)
+        >>> IndexResult(items=[], index_count=0)
     """
 
-    _items: Set[int]
+    _items: Sequence[int]
     _index_count: int
 
-    def __init__(self, items: Set[int], index_count: int):
+    def __init__(self, items: Sequence[int], index_count: int):
         """Init IndexResult.
 
         Args:
-            items: Matching items from a query as indicies.
+            items: Matching items from a query as sorted indicies.
             index_count: Number of items in the index..
         """
         self._items = items
         self._index_count = index_count
 
     @property
-    def items(self) -> Set[int]:
+    def items(self) -> List[int]:
         """Return query result items."""
-        return self._items
+        return list(self._items)
+
+    @property
+    def _is_universe(self) -> bool:
+        """Return whether this result stands for every item in the index."""
+        return isinstance(self._items, range)
 
     def __invert__(self) -> "IndexResult":
         """Return the complement list.
@@ -56,8 +84,13 @@ class IndexResult:
         Usage:
             >>> ~IndexResult()
         """
+        if self._is_universe:
+            return IndexResult([], self._index_count)
+
         return IndexResult(
-            set(range(self._index_count)).difference(self._items),
+            difference_generator_and_sorted_lists(
+                range(self._index_count), self._items
+            ),
             self._index_count,
         )
 
@@ -73,8 +106,14 @@ class IndexResult:
         Usage:
             >>> IndexResult() & IndexResult()
         """
+        if self._is_universe:
+            return IndexResult(other._items, self._index_count)
+
+        if other._is_universe:
+            return IndexResult(self._items, self._index_count)
+
         return IndexResult(
-            self._items.intersection(other._items),
+            intersection_two_sorted_lists(self._items, other._items),
             self._index_count,
         )
 
@@ -90,8 +129,11 @@ class IndexResult:
         Usage:
             >>> IndexResult() | IndexResult()
         """
+        if self._is_universe or other._is_universe:
+            return IndexResult(range(self._index_count), self._index_count)
+
         return IndexResult(
-            self._items.union(other._items),
+            union_two_sorted_lists(self._items, other._items),
             self._index_count,
         )
 
@@ -108,12 +150,19 @@ class Index:
     """
 
     _num_items: int
-    _tags: Dict[str, Dict[Union[None, str], List[int]]]
-    _fields: Dict[str, List[Tuple[int, Optional[float]]]]
-    _measurements: Dict[str, List[int]]
-    _timestamps: List[float]
+    _tags: DefaultDict[str, DefaultDict[Union[None, str], "array[int]"]]
+    _fields: DefaultDict[str, List[Tuple[int, Optional[float]]]]
+    _measurements: DefaultDict[str, "array[int]"]
+    _timestamps: "array[float]"
     _valid: bool
-    _storage_pos_sorted_by_ts: List[int]
+    _storage_pos_sorted_by_ts: "array[int]"
+    _storage_in_time_order: bool
+    _key_matches: Dict[SimpleQuery, Dict[Any, bool]]
+    _leaf_searches: Dict[str, Callable[[SimpleQuery], List[int]]]
+    _time_searches: Dict[Callable, Callable[[float], List[int]]]
+
+    # Number of queries for which key test results are kept.
+    _key_matches_capacity: int = 10
 
     def __init__(self, valid: bool = True) -> None:
         """Initialize an Index.
@@ -124,12 +173,30 @@ class Index:
             valid: Index represents current state of TinyFlux.
         """
         self._num_items = 0
-        self._tags = {}
-        self._fields = {}
-        self._measurements = {}
-        self._timestamps = []
+        self._tags = defaultdict(lambda: defaultdict(lambda: array("q")))
+        self._fields = defaultdict(list)
+        self._measurements = defaultdict(lambda: array("q"))
+        self._timestamps = array("d")
         self._valid = valid
-        self._storage_pos_sorted_by_ts = []
+        self._storage_pos_sorted_by_ts = array("q")
+        self._storage_in_time_order = True
+        self._key_matches = {}
+
+        # Search methods by point attribute and by time comparison operator.
+        self._leaf_searches = {
+            "_time": self._search_timestamps,
+            "_measurement": self._search_measurement,
+            "_tags": self._search_tags,
+            "_fields": self._search_fields,
+        }
+        self._time_searches = {
+            operator.eq: self._search_time_eq,
+            operator.ne: self._search_time_ne,
+            operator.lt: self._search_time_lt,
+            operator.le: self._search_time_le,
+            operator.gt: self._search_time_gt,
+            operator.ge: self._search_time_ge,
+        }
 
     @property
     def empty(self) -> bool:
@@ -150,9 +217,7 @@ class Index:
     @property
     def latest_time(self) -> datetime:
         """Return the latest time in the index."""
-        return datetime.fromtimestamp(self._timestamps[-1]).astimezone(
-            timezone.utc
-        )
+        return datetime.fromtimestamp(self._timestamps[-1], timezone.utc)
 
     def __len__(self) -> int:
         """Return number of items in the index."""
@@ -179,28 +244,53 @@ class Index:
         """
         self._reset()
 
-        # A buffer for the new timestamps and their storage positions.
-        timestamp_buffer: List[Tuple[float, int]] = []
+        # A buffer for the new timestamps, in storage order.
+        timestamps: "array[float]" = array("d")
+        in_time_order = True
+        last_ts = float("-inf")
+
+        # Bind the per-point helpers once, so the loop makes no attribute
+        # lookups. The helpers are shared with insert().
+        insert_measurements = self._insert_measurements
+        insert_tags = self._insert_tags
+        insert_fields = self._insert_fields
+        add_timestamp = timestamps.append
 
         for idx, point in enumerate(points):
-            self._num_items += 1
-            self._insert_measurements(idx, point.measurement)
-            self._insert_tags(idx, point.tags)
-            self._insert_fields(idx, point.fields)
+            insert_measurements(idx, point.measurement)
+            insert_tags(idx, point.tags)
+            insert_fields(idx, point.fields)
 
-            if not point.time:  # pragma: no cover
+            time = point.time
+
+            if not time:  # pragma: no cover
                 raise ValueError
 
-            timestamp_buffer.append((point.time.timestamp(), idx))
+            ts = time.timestamp()
+
+            if ts < last_ts:
+                in_time_order = False
+
+            last_ts = ts
+            add_timestamp(ts)
 
-        # Sort the timestamp buffer by timestamp.
-        timestamp_buffer.sort(key=lambda x: x[0])
+        self._num_items = len(timestamps)
+
+        # Storage is already in time order, no sort is necessary.
+        if in_time_order:
+            self._timestamps = timestamps
+            self._storage_pos_sorted_by_ts = array("q", range(len(timestamps)))
+
+        # Sort the storage positions by timestamp. The sort is stable, so
+        # equal timestamps keep their storage order.
+        else:
+            positions = sorted(
+                range(len(timestamps)), key=timestamps.__getitem__
+            )
+            self._timestamps = array("d", (timestamps[i] for i in positions))
+            self._storage_pos_sorted_by_ts = array("q", positions)
 
-        # Split up the tuple into their own lists.
-        # We have to do this because the bisect library does not work on
-        # containers prior to py310.
-        self._timestamps = [i[0] for i in timestamp_buffer]
-        self._storage_pos_sorted_by_ts = [i[1] for i in timestamp_buffer]
+        self._storage_in_time_order = in_time_order
 
         return
 
@@ -376,7 +466,7 @@ class Index:
         else:
             rst = {i: set({}) for i in tag_keys}
 
-            if measurement in self._measurements:
+            if measurement and measurement in self._measurements:
                 measurement_items = set(self._measurements[measurement])
             else:
                 return rst
@@ -399,33 +489,32 @@ class Index:
         Returns:
             List of timestamps.
         """
+        # Timestamps in storage order.
+        if self._storage_in_time_order:
+            timestamps = self._timestamps
+        else:
+            timestamps = array("d", [0.0]) * len(self._timestamps)
+            for ts, pos in zip(
+                self._timestamps, self._storage_pos_sorted_by_ts
+            ):
+                timestamps[pos] = ts
+
         # No measurement specified.
         if not measurement:
-            zipped = [
-                (i, j)
-                for i, j in zip(
-                    self._timestamps, self._storage_pos_sorted_by_ts
-                )
-            ]
-            return [i[0] for i in sorted(zipped, key=lambda x: x[1])]
+            return list(timestamps)
 
         # No measurement in the DB.
         if measurement not in self._measurements:
             return []
 
-        # If there is a measurement in the DB, we intersect.
-        zipped = [
-            (i, j)
-            for i, j in zip(self._timestamps, self._storage_pos_sorted_by_ts)
-            if j in set(self._measurements[measurement])
-        ]
-        return [i[0] for i in sorted(zipped, key=lambda x: x[1])]
+        # The measurement's storage positions are already sorted.
+        return [timestamps[i] for i in self._measurements[measurement]]
 
     def insert(self, points: List[Point] = []) -> None:
         """Update index with new points.
 
-        Accepts new points to add to an Index.  Points are assumed to be passed
-        to this method in non-descending time order.
+        Accepts new points to add to an Index.  Points passed out of time order
+        are placed in sorted position, which is slower than appending.
 
         Args:
             points: List of tinyflux.Point instances.
@@ -470,10 +559,13 @@ class Index:
 
     def remove(self, r_items: Set[int]) -> None:
         """Remove items from the index."""
-        self._remove_timestamps(r_items)
-        self._remove_measurements(r_items)
-        self._remove_tags(r_items)
-        self._remove_fields(r_items)
+        # Sorted once, to find the posting lists holding any removed items.
+        r_sorted = sorted(r_items)
+
+        self._remove_timestamps(r_items, r_sorted)
+        self._remove_measurements(r_items, r_sorted)
+        self._remove_tags(r_items, r_sorted)
+        self._remove_fields(r_items, r_sorted)
         self._num_items -= len(r_items)
 
         return
@@ -499,12 +591,36 @@ class Index:
     def update(self, u_items: Dict[int, int]) -> None:
         """Update the index.
 
+        The mapping must preserve the order of indices, as the compaction of
+        storage after a removal does, so that posting lists stay sorted
+        without a re-sort.
+
         Args:
             u_items: A mapping of old indices to update indices.
         """
-        self._update_measurements(u_items)
-        self._update_tags(u_items)
-        self._update_fields(u_items)
+        if not u_items:
+            return
+
+        # Every item has a measurement, so the measurement posting lists hold
+        # the largest index in the Index.
+        size = max(
+            max(u_items),
+            max((i[-1] for i in self._measurements.values()), default=0),
+        )
+
+        # Indices before the first updated one are unchanged.
+        first = min(u_items)
+
+        # A dense lookup table of old indices from first onwards to new ones,
+        # so each posting list is remapped by plain list indexing. Indices not
+        # in u_items map to themselves.
+        mapping = list(range(first, size + 1))
+        for old, new in u_items.items():
+            mapping[old - first] = new
+
+        self._update_measurements(mapping, first)
+        self._update_tags(mapping, first)
+        self._update_fields(mapping, first)
 
         return
 
@@ -516,10 +632,7 @@ class Index:
             fields: Dict of Field key/vals.
         """
         for field_key, field_value in fields.items():
-            if field_key not in self._fields:
-                self._fields[field_key] = [(idx, field_value)]
-            else:
-                self._fields[field_key].append((idx, field_value))
+            self._fields[field_key].append((idx, field_value))
 
         return
 
@@ -530,10 +643,7 @@ class Index:
             idx: Index of the point.
             measurement: Name of measurement.
         """
-        if measurement not in self._measurements:
-            self._measurements[measurement] = [idx]
-        else:
-            self._measurements[measurement].append(idx)
+        self._measurements[measurement].append(idx)
 
         return
 
@@ -545,13 +655,7 @@ class Index:
             tags: Dict of Tag key/vals.
         """
         for tag_key, tag_value in tags.items():
-            if tag_key not in self._tags:
-                self._tags[tag_key] = {}
-
-            if tag_value not in self._tags[tag_key]:
-                self._tags[tag_key][tag_value] = [idx]
-            else:
-                self._tags[tag_key][tag_value].append(idx)
+            self._tags[tag_key][tag_value].append(idx)
 
         return
 
@@ -561,11 +665,21 @@ class Index:
         Args:
             time: Time to index.
         """
-        # Add the new storage position.
-        self._storage_pos_sorted_by_ts.append(len(self._timestamps))
-
-        # Add the timestamp.
-        self._timestamps.append(time.timestamp())
+        ts = time.timestamp()
+        pos = len(self._timestamps)
+
+        # In time order, append to the tail.
+        if not pos or ts >= self._timestamps[-1]:
+            self._storage_pos_sorted_by_ts.append(pos)
+            self._timestamps.append(ts)
+            return
+
+        # Out of time order, insert after any equal timestamps so that both
+        # the timestamps and their storage positions stay sorted.
+        i = bisect.bisect_right(self._timestamps, ts)
+        self._storage_pos_sorted_by_ts.insert(i, pos)
+        self._timestamps.insert(i, ts)
+        self._storage_in_time_order = False
 
         return
 
@@ -575,40 +689,184 @@ class Index:
         Empty the index out.
         """
         self._num_items = 0
-        self._tags = {}
-        self._fields = {}
-        self._measurements = {}
-        self._timestamps = []
+        self._tags = defaultdict(lambda: defaultdict(lambda: array("q")))
+        self._fields = defaultdict(list)
+        self._measurements = defaultdict(lambda: array("q"))
+        self._timestamps = array("d")
+        self._storage_pos_sorted_by_ts = array("q")
+        self._storage_in_time_order = True
+        self._key_matches = {}
 
         self._valid = True
 
         return
 
-    def _search_fields(self, query: SimpleQuery) -> Set[int]:
+    def _search_fields(self, query: SimpleQuery) -> List[int]:
         """Search the index for field matches.
 
         Args:
             query: A SimpleQuery instance.
 
         Returns:
-            A list of candidates by index value.
+            A sorted list of candidates by index value.
         """
-        rst_items: Set[int] = set([])
+        matches: List[List[int]] = []
+        test = query._test
+        key_matches = self._get_key_matches(query)
 
         for field_key, items in self._fields.items():
             # Transform the key. We're only concerned with whether or not a
             # storage item has a relevant field key before testing its value.
             # It if does, then we the values, and add these items to results.
-            try:
-                query._path_resolver({field_key: 0.0})
-            except Exception:
+            resolves = key_matches.get(field_key)
+
+            if resolves is None:
+                try:
+                    query._path_resolver({field_key: 0.0})
+                    resolves = True
+                except Exception:
+                    resolves = False
+
+                key_matches[field_key] = resolves
+
+            if not resolves:
+                continue
+
+            matches.append(
+                [idx for idx, test_value in items if test(test_value)]
+            )
+
+        # Merge the matches of every field key at once.
+        return union_sorted_lists(matches)
+
+    def _get_key_matches(self, query: SimpleQuery) -> Dict[Any, bool]:
+        """Get the cached key test results of a query.
+
+        Whether a query matches a measurement, tag key/value or field key
+        depends only on the query and the key, so the result is kept for
+        repeated searches with an equal query. Queries with no hash, or an
+        empty one that never compares equal, are not cached.
+
+        Args:
+            query: A SimpleQuery instance.
+
+        Returns:
+            A mutable mapping of keys to test results.
+        """
+        if not query._hash:
+            return {}
+
+        # Test arguments may still be unhashable.
+        try:
+            key_matches = self._key_matches.get(query)
+        except TypeError:
+            return {}
+
+        if key_matches is None:
+            # Evict the oldest query.
+            if len(self._key_matches) >= self._key_matches_capacity:
+                del self._key_matches[next(iter(self._key_matches))]
+
+            key_matches = self._key_matches[query] = {}
+
+        return key_matches
+
+    def _flatten_compound(
+        self, query: CompoundQuery, op: Callable[..., bool]
+    ) -> List[Optional[Query]]:
+        """Collect the operands of a chain of one logical connective.
+
+        A query like 'a & b & c & d' is a nested tree of CompoundQueries. This
+        returns its leaves as ['a', 'b', 'c', 'd'], so the chain is evaluated
+        in one step instead of one IndexResult per node.
+
+        Args:
+            query: A CompoundQuery.
+            op: The connective of the chain (operator.and_ or operator.or_).
+
+        Returns:
+            The operands of the chain, from left to right.
+        """
+        operands: List[Optional[Query]] = []
+        stack: List[Optional[Query]] = [query]
+
+        while stack:
+            q = stack.pop()
+
+            if isinstance(q, CompoundQuery) and q.operator == op:
+                stack.append(q.query2)
+                stack.append(q.query1)
+            else:
+                operands.append(q)
+
+        return operands
+
+    def _search_and(self, operands: List[Optional[Query]]) -> IndexResult:
+        """Return the IndexResult of a logical-AND of queries.
+
+        Operands are intersected from the smallest result to the largest,
+        which keeps every intermediate result as small as possible. Evaluation
+        stops as soon as any result is empty.
+
+        Args:
+            operands: The queries to intersect.
+
+        Returns:
+            An IndexResult instance.
+        """
+        results = []
+
+        for q in operands:
+            rst = self._search_helper(q)
+
+            # Nothing can match, skip the remaining operands.
+            if not rst._items:
+                return IndexResult([], self._num_items)
+
+            # Every item matches, so this operand does not narrow the result.
+            if rst._is_universe:
                 continue
 
-            for idx, test_value in items:
-                if query._test(test_value):
-                    rst_items.add(idx)
+            results.append(rst._items)
+
+        if not results:
+            return IndexResult(range(self._num_items), self._num_items)
+
+        results.sort(key=len)
+        rst_items = results[0]
+
+        for items in results[1:]:
+            rst_items = intersection_two_sorted_lists(rst_items, items)
 
-        return rst_items
+            if not rst_items:
+                break
+
+        return IndexResult(rst_items, self._num_items)
+
+    def _search_or(self, operands: List[Optional[Query]]) -> IndexResult:
+        """Return the IndexResult of a logical-OR of queries.
+
+        The results of all operands are merged at once rather than pairwise.
+        Evaluation stops as soon as any result holds every item.
+
+        Args:
+            operands: The queries to unite.
+
+        Returns:
+            An IndexResult instance.
+        """
+        results = []
+
+        for q in operands:
+            rst = self._search_helper(q)
+
+            # Every item matches, skip the remaining operands.
+            if rst._is_universe:
+                return rst
+
+            results.append(rst._items)
+
+        return IndexResult(union_sorted_lists(results), self._num_items)
 
     def _search_helper(self, query: Optional[Query]) -> IndexResult:
         """Return an IndexResult from a parsed query.
@@ -623,208 +881,280 @@ class Index:
         """
         if isinstance(query, CompoundQuery):
             if query.operator == operator.and_:
-                rst1 = self._search_helper(query.query1)
-                rst2 = self._search_helper(query.query2)
-                return rst1 & rst2
+                return self._search_and(
+                    self._flatten_compound(query, operator.and_)
+                )
 
             if query.operator == operator.or_:
-                rst1 = self._search_helper(query.query1)
-                rst2 = self._search_helper(query.query2)
-                return rst1 | rst2
+                return self._search_or(
+                    self._flatten_compound(query, operator.or_)
+                )
 
             if query.operator == operator.not_:
-                rst = self._search_helper(query.query1)
-
                 # For logical-NOT with a FieldQuery, we have to check every
                 # single item in storage :(
                 if (
                     isinstance(query.query1, SimpleQuery)
                     and query.query1._point_attr == "_fields"
                 ):
-                    rst._items = set(range(self._num_items))
-                    return rst
-                else:
-                    return ~rst
-
-        if isinstance(query, SimpleQuery):
-            if query.point_attr == "_time":
-                return IndexResult(
-                    self._search_timestamps(query), self._num_items
-                )
+                    return IndexResult(range(self._num_items), self._num_items)
 
-            if query.point_attr == "_measurement":
-                return IndexResult(
-                    self._search_measurement(query), self._num_items
-                )
+                return ~self._search_helper(query.query1)
 
-            if query.point_attr == "_tags":
-                return IndexResult(self._search_tags(query), self._num_items)
+        if isinstance(query, SimpleQuery):
+            search = self._leaf_searches.get(query.point_attr)
 
-            if query.point_attr == "_fields":
-                return IndexResult(self._search_fields(query), self._num_items)
+            if search is not None:
+                return IndexResult(search(query), self._num_items)
 
         raise TypeError("Query must be SimpleQuery or CompoundQuery.")
 
-    def _search_measurement(self, query: SimpleQuery) -> Set[int]:
+    def _search_measurement(self, query: SimpleQuery) -> List[int]:
         """Search the index for measurement matches.
 
         Args:
             query: A SimpleQuery instance.
 
         Returns:
-            A list of matches by index value.
+            A sorted list of matches by index value.
         """
-        rst_items: Set[int] = set([])
+        matches: List["array[int]"] = []
+        key_matches = self._get_key_matches(query)
 
         for key, items in self._measurements.items():
-            # Transform the key.
-            test_value = query._path_resolver(key)
+            match = key_matches.get(key)
 
-            # If it matches, update the list.
-            if query._test(test_value):
-                rst_items = rst_items.union(set(items))
+            # Transform the key and test it.
+            if match is None:
+                match = bool(query._test(query._path_resolver(key)))
+                key_matches[key] = match
+
+            # If it matches, keep its posting list.
+            if match:
+                matches.append(items)
 
-        return rst_items
+        # Merge the posting lists of every matching measurement at once.
+        return union_sorted_lists(matches)
 
-    def _search_tags(self, query: SimpleQuery) -> Set[int]:
+    def _search_tags(self, query: SimpleQuery) -> List[int]:
         """Search the index for tag matches.
 
         Args:
             query: A SimpleQuery instance.
 
         Returns:
-            A list of matches as index values.
+            A sorted list of matches as index values.
         """
-        rst_items: Set[int] = set([])
+        matches: List["array[int]"] = []
+        key_matches = self._get_key_matches(query)
 
         for tag_key, tag_values in self._tags.items():
             for value, items in tag_values.items():
-                # Transform the key.
-                try:
-                    test_value = query._path_resolver({tag_key: value})
-                except Exception:
-                    continue
+                match = key_matches.get((tag_key, value))
+
+                # Transform the key and test it.
+                if match is None:
+                    try:
+                        test_value = query._path_resolver({tag_key: value})
+                    except Exception:
+                        match = False
+                    else:
+                        match = bool(query._test(test_value))
 
-                # If it matches, update the list.
-                if query._test(test_value):
-                    rst_items = rst_items.union(set(items))
+                    key_matches[(tag_key, value)] = match
 
-        return rst_items
+                # If it matches, keep its posting list.
+                if match:
+                    matches.append(items)
 
-    def _search_timestamps(self, query: SimpleQuery) -> Set[int]:
+        # Merge the posting lists of every matching tag at once.
+        return union_sorted_lists(matches)
+
+    def _search_timestamps(self, query: SimpleQuery) -> List[int]:
         """Search for a timestamp.
 
-        Search function for searching the timestamp index.
+        Search function for searching the timestamp index. Comparison
+        operators are dispatched to a bisection search, all other tests are
+        evaluated against every timestamp.
 
         Args:
-            func: The operator or test of a query.
-            rhs: The right-hand-side of the operator.
+            query: A SimpleQuery instance.
 
         Returns:
-            A list of matches as a list of indices.
+            A sorted list of matches as a list of indices.
         """
-        op = query._operator
-        rhs = query._rhs
+        # A user-defined test function may be unhashable.
+        try:
+            search = self._time_searches.get(query._operator)
+        except TypeError:
+            search = None
+
+        if search is not None:
+            return search(query._rhs.timestamp())
+
+        # All other operators. Timestamps are sorted, so each run of equal
+        # timestamps is converted and tested only once.
+        items = []
+        test = query._test
+        path_resolver = query._path_resolver
+        last_timestamp = None
+        match = False
+
+        for idx, timestamp in zip(
+            self._storage_pos_sorted_by_ts, self._timestamps
+        ):
+            if timestamp != last_timestamp:
+                match = test(
+                    path_resolver(
+                        datetime.fromtimestamp(timestamp, timezone.utc)
+                    )
+                )
+                last_timestamp = timestamp
 
-        # Exact timestamp match.
-        if op == operator.eq:
-            # Find the exact match, or return empty set if None.
-            match = find_eq(self._timestamps, rhs.timestamp())
-            if match is None:
-                return set([])
+            if match:
+                items.append(idx)
 
-            # Find the other timestamps with same value.
-            results = set([self._storage_pos_sorted_by_ts[match]])
-            match += 1
+        if self._storage_in_time_order:
+            return items
 
-            while match < len(self._timestamps):
-                if self._timestamps[match] != rhs.timestamp():
-                    break
+        return sorted(items)
 
-                results.add(self._storage_pos_sorted_by_ts[match])
-                match += 1
+    def _search_time_eq(self, ts: float) -> List[int]:
+        """Search for timestamps equal to ts.
 
-            return results
+        Args:
+            ts: The timestamp to search.
 
-        # Anything except exact timestamp match.
-        elif op == operator.ne:
-            # Find the exact match, or return full set if None.
-            match = find_eq(self._timestamps, rhs.timestamp())
-            if match is None:
-                return set(self._storage_pos_sorted_by_ts)
+        Returns:
+            A sorted list of matches as a list of indices.
+        """
+        # The run of timestamps equal to ts, which may be empty.
+        return self._storage_positions(
+            bisect.bisect_left(self._timestamps, ts),
+            bisect.bisect_right(self._timestamps, ts),
+        )
 
-            # Find the other timestamps with same value.
-            results = set([self._storage_pos_sorted_by_ts[match]])
-            match += 1
+    def _search_time_ne(self, ts: float) -> List[int]:
+        """Search for timestamps not equal to ts.
 
-            while match < len(self._timestamps):
-                if self._timestamps[match] != rhs.timestamp():
-                    break
+        Args:
+            ts: The timestamp to search.
 
-                results.add(self._storage_pos_sorted_by_ts[match])
-                match += 1
+        Returns:
+            A sorted list of matches as a list of indices.
+        """
+        n = len(self._timestamps)
 
-            return set(self._storage_pos_sorted_by_ts).difference(results)
+        # The run of timestamps equal to ts, which may be empty.
+        start = bisect.bisect_left(self._timestamps, ts)
+        end = bisect.bisect_right(self._timestamps, ts, start)
 
-        # Everything less than rhs.
-        elif op == operator.lt:
-            match = find_lt(self._timestamps, rhs.timestamp())
-            if match is None:
-                return set([])
+        # Everything before and after the run of matches.
+        if self._storage_in_time_order:
+            return [*range(start), *range(end, n)]
 
-            return set(self._storage_pos_sorted_by_ts[: match + 1])
+        return sorted(
+            self._storage_pos_sorted_by_ts[:start]
+            + self._storage_pos_sorted_by_ts[end:]
+        )
 
-        # Every less than or equal to rhs.
-        elif op == operator.le:
-            match = find_le(self._timestamps, rhs.timestamp())
-            if match is None:
-                return set([])
+    def _search_time_lt(self, ts: float) -> List[int]:
+        """Search for timestamps less than ts.
 
-            return set(self._storage_pos_sorted_by_ts[: match + 1])
+        Args:
+            ts: The timestamp to search.
 
-        # Everything greater than rhs.
-        elif op == operator.gt:
-            match = find_gt(self._timestamps, rhs.timestamp())
-            if match is None:
-                return set([])
+        Returns:
+            A sorted list of matches as a list of indices.
+        """
+        return self._storage_positions(
+            0, bisect.bisect_left(self._timestamps, ts)
+        )
 
-            return set(self._storage_pos_sorted_by_ts[match:])
+    def _search_time_le(self, ts: float) -> List[int]:
+        """Search for timestamps less than or equal to ts.
 
-        # Everything greater than or equal to rhs.
-        elif op == operator.ge:
-            match = find_ge(self._timestamps, rhs.timestamp())
-            if match is None:
-                return set([])
+        Args:
+            ts: The timestamp to search.
 
-            return set(self._storage_pos_sorted_by_ts[match:])
+        Returns:
+            A sorted list of matches as a list of indices.
+        """
+        return self._storage_positions(
+            0, bisect.bisect_right(self._timestamps, ts)
+        )
 
-        # All other operators.
-        else:
-            items = set([])
-            for idx, timestamp in zip(
-                self._storage_pos_sorted_by_ts, self._timestamps
-            ):
-                if query._test(
-                    query._path_resolver(
-                        datetime.fromtimestamp(timestamp).astimezone(
-                            timezone.utc
-                        )
-                    )
-                ):
-                    items.add(idx)
+    def _search_time_gt(self, ts: float) -> List[int]:
+        """Search for timestamps greater than ts.
 
-            return items
+        Args:
+            ts: The timestamp to search.
+
+        Returns:
+            A sorted list of matches as a list of indices.
+        """
+        return self._storage_positions(
+            bisect.bisect_right(self._timestamps, ts), len(self._timestamps)
+        )
+
+    def _search_time_ge(self, ts: float) -> List[int]:
+        """Search for timestamps greater than or equal to ts.
+
+        Args:
+            ts: The timestamp to search.
+
+        Returns:
+            A sorted list of matches as a list of indices.
+        """
+        return self._storage_positions(
+            bisect.bisect_left(self._timestamps, ts), len(self._timestamps)
+        )
+
+    def _storage_positions(self, start: int, stop: int) -> List[int]:
+        """Get the storage positions of a slice of the timestamp index.
+
+        When storage is in time order, the positions are the slice bounds
+        themselves and no lookup or sort is needed.
+
+        Args:
+            start: Start of the slice of sorted timestamps.
+            stop: End (exclusive) of the slice of sorted timestamps.
+
+        Returns:
+            A sorted list of storage positions.
+        """
+        if self._storage_in_time_order:
+            return list(range(start, stop))
 
-    def _remove_fields(self, r_items: Set[int]) -> None:
+        return sorted(self._storage_pos_sorted_by_ts[start:stop])
+
+    def _remove_fields(self, r_items: Set[int], r_sorted: List[int]) -> None:
         """Remove indices from fields index.
 
         Args:
             r_items: A set of indices to remove.
+            r_sorted: The indices to remove, sorted.
         """
-        new_fields = {}
+        new_fields: DefaultDict[
+            str, List[Tuple[int, Optional[float]]]
+        ] = defaultdict(list)
 
         for field_key, old_items in self._fields.items():
-            new_items = [i for i in old_items if i[0] not in r_items]
+            # No removed index falls within this posting list, keep it as is.
+            match = bisect.bisect_left(r_sorted, old_items[0][0])
+            if match == len(r_sorted) or r_sorted[match] > old_items[-1][0]:
+                new_fields[field_key] = old_items
+                continue
+
+            # Only items within the range of removed indices need a test.
+            lo = bisect.bisect_left(old_items, (r_sorted[0],))
+            hi = bisect.bisect_left(old_items, (r_sorted[-1] + 1,))
+
+            new_items = (
+                old_items[:lo]
+                + [i for i in old_items[lo:hi] if i[0] not in r_items]
+                + old_items[hi:]
+            )
             if new_items:
                 new_fields[field_key] = new_items
 
@@ -832,16 +1162,35 @@ class Index:
 
         return
 
-    def _remove_measurements(self, r_items: Set[int]) -> None:
+    def _remove_measurements(
+        self, r_items: Set[int], r_sorted: List[int]
+    ) -> None:
         """Remove indices from measurement index.
 
         Args:
             r_items: A set of indices to remove.
+            r_sorted: The indices to remove, sorted.
         """
-        new_measurements = {}
+        new_measurements: DefaultDict[str, "array[int]"] = defaultdict(
+            lambda: array("q")
+        )
+
+        for m, old_items in self._measurements.items():
+            # No removed index falls within this posting list, keep it as is.
+            match = bisect.bisect_left(r_sorted, old_items[0])
+            if match == len(r_sorted) or r_sorted[match] > old_items[-1]:
+                new_measurements[m] = old_items
+                continue
+
+            # Only items within the range of removed indices need a test.
+            lo = bisect.bisect_left(old_items, r_sorted[0])
+            hi = bisect.bisect_right(old_items, r_sorted[-1])
 
-        for m in self._measurements.keys():
-            new_items = [i for i in self._measurements[m] if i not in r_items]
+            new_items = (
+                old_items[:lo]
+                + array("q", [i for i in old_items[lo:hi] if i not in r_items])
+                + old_items[hi:]
+            )
             if new_items:
                 new_measurements[m] = new_items
 
@@ -849,82 +1198,143 @@ class Index:
 
         return
 
-    def _remove_tags(self, r_items: Set[int]) -> None:
+    def _remove_tags(self, r_items: Set[int], r_sorted: List[int]) -> None:
         """Remove indices from tags index.
 
         Args:
             r_items: A set of indices to remove.
+            r_sorted: The indices to remove, sorted.
         """
-        new_tags = {}
+        new_tags: DefaultDict[
+            str, DefaultDict[Union[None, str], "array[int]"]
+        ] = defaultdict(lambda: defaultdict(lambda: array("q")))
 
         for tag_key, tag_values in self._tags.items():
             for value, old_items in tag_values.items():
-                new_items = [i for i in old_items if i not in r_items]
+                # No removed index falls within this posting list.
+                match = bisect.bisect_left(r_sorted, old_items[0])
+                if match == len(r_sorted) or r_sorted[match] > old_items[-1]:
+                    new_items = old_items
+
+                # Only items within the range of removed indices need a test.
+                else:
+                    lo = bisect.bisect_left(old_items, r_sorted[0])
+                    hi = bisect.bisect_right(old_items, r_sorted[-1])
+
+                    new_items = (
+                        old_items[:lo]
+                        + array(
+                            "q",
+                            [i for i in old_items[lo:hi] if i not in r_items],
+                        )
+                        + old_items[hi:]
+                    )
 
                 if not new_items:
                     continue
 
-                if tag_key not in new_tags:
-                    new_tags[tag_key] = {value: new_items}
-                else:
-                    new_tags[tag_key][value] = new_items
+                new_tags[tag_key][value] = new_items
 
         self._tags = new_tags
 
         return
 
-    def _remove_timestamps(self, r_items: Set[int]) -> None:
+    def _remove_timestamps(
+        self, r_items: Set[int], r_sorted: List[int]
+    ) -> None:
         """Remove indices from timestamps index.
 
         Args:
             r_items: A set of indices to remove.
+            r_sorted: The indices to remove, sorted.
         """
-        new_timestamps = []
+        # Storage positions and timestamp positions are the same.
+        if self._storage_in_time_order:
+            self._timestamps = array(
+                "d",
+                (
+                    ts
+                    for i, ts in enumerate(self._timestamps)
+                    if i not in r_items
+                ),
+            )
+            self._storage_pos_sorted_by_ts = array(
+                "q", range(len(self._timestamps))
+            )
+
+            return
+
+        # Remaining items shift down by the number of removed items before
+        # them in storage.
+        new_timestamps: "array[float]" = array("d")
+        new_positions: "array[int]" = array("q")
+
+        for ts, pos in zip(self._timestamps, self._storage_pos_sorted_by_ts):
+            if pos in r_items:
+                continue
 
-        for i, ts in enumerate(self._timestamps):
-            if i not in r_items:
-                new_timestamps.append(ts)
+            new_timestamps.append(ts)
+            new_positions.append(pos - bisect.bisect_left(r_sorted, pos))
 
         self._timestamps = new_timestamps
+        self._storage_pos_sorted_by_ts = new_positions
 
         return
 
-    def _update_fields(self, u_items: Dict[int, int]) -> None:
+    def _update_fields(self, mapping: List[int], first: int) -> None:
         """Update fields index.
 
         Args:
-            u_items: A mapping of old indices to new indices.
+            mapping: A lookup table of old indices, less first, to new indices.
+            first: The smallest old index that changes.
         """
         for field_key, old_items in self._fields.items():
-            self._fields[field_key] = [
-                (u_items[i[0]], i[1]) if i[0] in u_items else i
-                for i in old_items
+            # Only items from the first updated index onwards are remapped.
+            lo = bisect.bisect_left(old_items, (first,))
+            if lo == len(old_items):
+                continue
+
+            self._fields[field_key] = old_items[:lo] + [
+                (mapping[idx - first], value) for idx, value in old_items[lo:]
             ]
 
         return
 
-    def _update_measurements(self, u_items: Dict[int, int]) -> None:
+    def _update_measurements(self, mapping: List[int], first: int) -> None:
         """Update measurements index.
 
         Args:
-            u_items: A mapping of old indices to new indices.
+            mapping: A lookup table of old indices, less first, to new indices.
+            first: The smallest old index that changes.
         """
         for measurement, old_items in self._measurements.items():
-            self._measurements[measurement] = [
-                u_items[i] if i in u_items else i for i in old_items
-            ]
+            # Only items from the first updated index onwards are remapped.
+            lo = bisect.bisect_left(old_items, first)
+            if lo == len(old_items):
+                continue
+
+            self._measurements[measurement] = old_items[:lo] + array(
+                "q", [mapping[i - first] for i in old_items[lo:]]
+            )
 
         return
 
-    def _update_tags(self, u_items: Dict[int, int]) -> None:
+    def _update_tags(self, mapping: List[int], first: int) -> None:
         """Update tags index.
 
         Args:
-            u_items: A mapping of old indices to new indices.
+            mapping: A lookup table of old indices, less first, to new indices.
+            first: The smallest old index that changes.
         """
         for tag_key, tag_values in self._tags.items():
             for value, old_items in tag_values.items():
-                self._tags[tag_key][value] = [
-                    u_items[i] if i in u_items else i for i in old_items
-                ]
+                # Only items from the first updated index onwards are remapped.
+                lo = bisect.bisect_left(old_items, first)
+                if lo == len(old_items):
+                    continue
+
+                tag_values[value] = old_items[:lo] + array(
+                    "q", [mapping[i - first] for i in old_items[lo:]]
+                )
+
         return
@@ -657,8 +657,8 @@ class BaseQuery:
         Warning:
             The test fuction provided needs to be deterministic (returning the
             same value when provided with the same arguments), otherwise this
-            may mess up the query cache that :class:`~tinyflux.table.Table`
-            implements.
+            may mess up the cache of key test results that the Index keeps
+            for each query.
 
         Args:
             func: The function to call, passing the value as the first arg.
@@ -695,7 +695,7 @@ class BaseQuery:
             test_against_rhs=False,
             rhs=None,
             args=None,
-            hashval=(self._point_attr, "matches", self._path, regex),
+            hashval=(self._point_attr, "matches", self._path, regex, flags),
         )
 
     def search(self, regex: str, flags: int = 0) -> SimpleQuery:
@@ -717,7 +717,7 @@ class BaseQuery:
             test_against_rhs=False,
             rhs=None,
             args=None,
-            hashval=(self._point_attr, "search", self._path, regex),
+            hashval=(self._point_attr, "search", self._path, regex, flags),
         )
 
     def noop(self) -> SimpleQuery:
@@ -1,6 +1,9 @@
 """Defintion of TinyFlux utils."""
 import bisect
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional, Sequence
+
+# Size ratio of two sorted lists above which intersection uses galloping.
+GALLOPING_THRESHOLD = 20
 
 
 class FrozenDict(dict):
@@ -57,91 +60,157 @@ def freeze(obj: object) -> object:
         return obj
 
 
-def find_eq(sorted_list: List[Any], x: Any) -> Optional[int]:
-    """Locate the leftmost value exactly equal to x.
+def difference_generator_and_sorted_lists(
+    g: Iterable[int], sorted_list: Sequence[int]
+) -> List[int]:
+    """Return the items of a generator that are not in a sorted list.
 
     Args:
-        sorted_list: The list to search.
-        x: The element to search.
+        g: An iterable of ints, in ascending order.
+        sorted_list: A sorted sequence of unique ints.
 
     Returns:
-        The index of the found element or None.
+        The items of g not in sorted_list, in ascending order.
     """
-    i = bisect.bisect_left(sorted_list, x)
+    exclude = set(sorted_list)
 
-    if i != len(sorted_list) and sorted_list[i] == x:
-        return i
+    return [i for i in g if i not in exclude]
 
-    return None
 
+def intersection_galloping(
+    small: Sequence[int], large: Sequence[int]
+) -> List[int]:
+    """Return the intersection of a small and a large sorted list.
 
-def find_lt(sorted_list: List[Any], x: Any) -> Optional[int]:
-    """Find rightmost value less than x.
+    Each item of the small list is located in the large list by exponential
+    (galloping) search from the previous match, then by bisection within the
+    gap found. This is O(m log n) rather than O(m + n).
 
     Args:
-        sorted_list: The list to search.
-        x: The element to search.
+        small: A sorted sequence of unique ints.
+        large: A sorted sequence of unique ints.
 
     Returns:
-        The index of the found element or None.
+        The intersection of small and large, in ascending order.
     """
-    i = bisect.bisect_left(sorted_list, x)
+    rst = []
+    n = len(large)
+    lo = 0
+
+    for x in small:
+        # Double the step until the gap containing x is found.
+        step = 1
+        hi = lo + 1
+
+        while hi < n and large[hi] < x:
+            lo = hi
+            step *= 2
+            hi = lo + step
+
+        lo = bisect.bisect_left(large, x, lo, min(hi, n))
 
-    if i:
-        return i - 1
+        # Every remaining item of small is greater than all of large.
+        if lo == n:
+            break
 
-    return None
+        if large[lo] == x:
+            rst.append(x)
 
+    return rst
 
-def find_le(sorted_list: List[Any], x: Any) -> Optional[int]:
-    """Find rightmost value less than or equal to x.
+
+def intersection_two_sorted_lists(
+    l1: Sequence[int], l2: Sequence[int]
+) -> List[int]:
+    """Return the intersection of two sorted lists.
+
+    Both lists are first clipped to the range where their values overlap.
+    The smaller list is then probed against a set of the larger one, so the
+    result keeps the ascending order of the inputs. When the larger list is
+    more than GALLOPING_THRESHOLD times the size of the smaller one, galloping
+    search is used instead.
 
     Args:
-        sorted_list: The list to search.
-        x: The element to search.
+        l1: A sorted sequence of unique ints.
+        l2: A sorted sequence of unique ints.
 
     Returns:
-        The index of the found element or None.
+        The intersection of l1 and l2, in ascending order.
     """
-    i = bisect.bisect_right(sorted_list, x)
+    if not l1 or not l2:
+        return []
+
+    lo = max(l1[0], l2[0])
+    hi = min(l1[-1], l2[-1])
+
+    # The value ranges do not overlap.
+    if lo > hi:
+        return []
 
-    if i:
-        return i - 1
+    # Only the overlapping ranges can hold common items.
+    l1 = l1[bisect.bisect_left(l1, lo) : bisect.bisect_right(l1, hi)]
+    l2 = l2[bisect.bisect_left(l2, lo) : bisect.bisect_right(l2, hi)]
 
-    return None
+    if len(l1) > len(l2):
+        l1, l2 = l2, l1
 
+    if len(l2) > GALLOPING_THRESHOLD * len(l1):
+        return intersection_galloping(l1, l2)
 
-def find_gt(sorted_list: List[Any], x: Any) -> Optional[int]:
-    """Find leftmost value greater than x.
+    lookup = set(l2)
+
+    return [i for i in l1 if i in lookup]
+
+
+def union_two_sorted_lists(l1: Sequence[int], l2: Sequence[int]) -> List[int]:
+    """Return the union of two sorted lists.
+
+    The new items of one list are appended to the other, and the two ascending
+    runs are merged by a single pass of the builtin sort.
 
     Args:
-        sorted_list: The list to search.
-        x: The element to search.
+        l1: A sorted sequence of unique ints.
+        l2: A sorted sequence of unique ints.
 
     Returns:
-        The index of the found element or None.
+        The union of l1 and l2, in ascending order.
     """
-    i = bisect.bisect_right(sorted_list, x)
+    if len(l1) < len(l2):
+        l1, l2 = l2, l1
 
-    if i != len(sorted_list):
-        return i
+    if not l2:
+        return list(l1)
 
-    return None
+    lookup = set(l1)
+    rst = list(l1)
+    rst.extend(i for i in l2 if i not in lookup)
+    rst.sort()
 
+    return rst
 
-def find_ge(sorted_list: List[Any], x: Any) -> Optional[int]:
-    """Find leftmost item greater than or equal to x.
+
+def union_sorted_lists(lists: Sequence[Sequence[int]]) -> List[int]:
+    """Return the union of any number of sorted lists.
+
+    All lists are merged in one step, rather than pairwise, so no intermediate
+    unions are built.
 
     Args:
-        sorted_list: The list to search.
-        x: The element to search.
+        lists: Sorted sequences of unique ints.
 
     Returns:
-        The index of the found element or None.
+        The union of all lists, in ascending order.
     """
-    i = bisect.bisect_left(sorted_list, x)
+    if not lists:
+        return []
+
+    if len(lists) == 1:
+        return list(lists[0])
+
+    if len(lists) == 2:
+        return union_two_sorted_lists(lists[0], lists[1])
 
-    if i != len(sorted_list):
-        return i
+    rst = list(set().union(*lists))
+    rst.sort()
 
-    return None
+    return rst